@@ -1,5 +1,6 @@
 import django_filters
-from .models import Task, Sprint
+from rest_framework.permissions import SAFE_METHODS
+from .models import Task, Sprint, ArchivedTask, ArchivedSprint
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -14,24 +15,57 @@ class NullFilter(django_filters.BooleanFilter):
         return qs
 
 
-class SprintFilter(django_filters.FilterSet):
+class ArchiveFilterMixin(object):
+    """Read from the archive tables when `archived` is set on a read request.
+
+    The archive models have the same fields as the live ones, so the other
+    filters apply unchanged to the swapped queryset.
+    """
+    archive_model = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.is_archived():
+            self.queryset = self.archive_model.objects.order_by(*self.queryset.query.order_by)
+
+    def is_archived(self):
+        if self.request is not None and self.request.method not in SAFE_METHODS:
+            return False
+        name = '%s-archived' % self.form_prefix if self.form_prefix else 'archived'
+        value = self.filters['archived'].field.widget.value_from_datadict(self.data or {}, {}, name)
+        return value is True
+
+    def filter_archived(self, qs, name, value):
+        # The queryset is swapped when the filter set is created
+        return qs
+
+
+class SprintFilter(ArchiveFilterMixin, django_filters.FilterSet):
     end_min = django_filters.DateFilter(name='end', lookup_expr='gte')
     end_max = django_filters.DateFilter(name='end', lookup_expr='lte')
+    archived = django_filters.BooleanFilter(method='filter_archived')
+
+    archive_model = ArchivedSprint
 
     class Meta:
         model = Sprint
-        fields = ('end_min', 'end_max')
+        fields = ('end_min', 'end_max', 'archived',)
 
 
-class TaskFilter(django_filters.FilterSet):
+class TaskFilter(ArchiveFilterMixin, django_filters.FilterSet):
     backlog = NullFilter(name='sprint')
+    archived = django_filters.BooleanFilter(method='filter_archived')
+
+    archive_model = ArchivedTask
 
     class Meta:
         model = Task
-        fields = ('sprint', 'status', 'assigned', 'backlog',)
+        fields = ('sprint', 'status', 'assigned', 'backlog', 'archived',)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.filters['assigned'].extra.update(
             {'to_field_name': User.USERNAME_FIELD}
         )
+        if self.is_archived():
+            self.filters['sprint'].queryset = ArchivedSprint.objects.all()
@@ -0,0 +1,49 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_date
+
+from board.models import Sprint, Task, ArchivedSprint, ArchivedTask
+
+
+def copy_rows(queryset, model):
+    """Insert the rows of `queryset` into `model`, keeping their ids."""
+    fields = [field.attname for field in model._meta.concrete_fields]
+    model.objects.bulk_create(model(**row) for row in queryset.values(*fields))
+
+
+class Command(BaseCommand):
+    help = ('Move sprints past their end, with their done tasks, to the archive tables. '
+            'Unfinished tasks of those sprints go back to the backlog.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--before', default=None,
+                            help='Archive sprints ending before this date (default: today)')
+        parser.add_argument('--dry-run', action='store_true', default=False,
+                            help='Only report what would be archived')
+
+    def handle(self, *args, **options):
+        before = date.today()
+        if options['before']:
+            before = parse_date(options['before'])
+            if before is None:
+                raise CommandError('Invalid date: {}'.format(options['before']))
+        with transaction.atomic():
+            # Lock the rows and fix the task ids once, so a status changing
+            # meanwhile can't leave a task both archived and in the backlog
+            ids = list(Sprint.objects.select_for_update().filter(
+                end__lt=before).values_list('pk', flat=True))
+            tasks = list(Task.objects.select_for_update().filter(
+                sprint__in=ids).values_list('pk', 'status'))
+            done = [pk for pk, status in tasks if status == Task.STATUS_DONE]
+            unfinished = [pk for pk, status in tasks if status != Task.STATUS_DONE]
+            self.stdout.write('{} sprint(s), {} done task(s), {} unfinished task(s) to backlog.'.format(
+                len(ids), len(done), len(unfinished)))
+            if options['dry_run'] or not ids:
+                return
+            copy_rows(Sprint.objects.filter(pk__in=ids), ArchivedSprint)
+            copy_rows(Task.objects.filter(pk__in=done), ArchivedTask)
+            Task.objects.filter(pk__in=unfinished).update(sprint=None)
+            Task.objects.filter(pk__in=done).delete()
+            Sprint.objects.filter(pk__in=ids).delete()
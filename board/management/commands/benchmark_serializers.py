@@ -0,0 +1,63 @@
+import timeit
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from board.models import Sprint, Task
+
+User = get_user_model()
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Compare list response times of the default and fast JSON paths.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=1000,
+                            help='Number of tasks in the benchmark sprint')
+        parser.add_argument('--repeat', type=int, default=20,
+                            help='Number of requests per measurement')
+
+    def handle(self, *args, **options):
+        # The fixtures are created inside a transaction which is always rolled back.
+        try:
+            with transaction.atomic():
+                self.benchmark(options['tasks'], options['repeat'])
+                raise Rollback()
+        except Rollback:
+            pass
+
+    def benchmark(self, count, repeat):
+        user = User.objects.create_user('benchmark-user', first_name='Bench', last_name='Mark')
+        sprint = Sprint.objects.create(name='Benchmark', end=date.today() + timedelta(days=3650))
+        Task.objects.bulk_create([
+            Task(name='Task {}'.format(i), description='Benchmark task', sprint=sprint,
+                 assigned=user if i % 2 else None, status=i % 4 + 1, order=i % 100,
+                 started=date.today())
+            for i in range(count)
+        ])
+        # Outside the test runner only localhost is an allowed host
+        client = APIClient(SERVER_NAME='localhost')
+        client.force_authenticate(user=user)
+        url = '/api/tasks?sprint={}'.format(sprint.pk)
+        responses = []
+        for fast in (False, True):
+            with override_settings(BOARD_FAST_JSON=fast):
+                responses.append(client.get(url, HTTP_ACCEPT='application/json'))
+        if any(response.status_code != 200 for response in responses):
+            raise CommandError('Requests failed with status {}'.format(
+                ', '.join(str(response.status_code) for response in responses)))
+        if responses[0].content != responses[1].content:
+            raise CommandError('Default and fast responses differ')
+        for label, fast in (('default', False), ('fast', True)):
+            with override_settings(BOARD_FAST_JSON=fast):
+                elapsed = timeit.timeit(
+                    lambda: client.get(url, HTTP_ACCEPT='application/json'), number=repeat)
+            self.stdout.write('{:<8} {:>8.2f} ms/request'.format(label, elapsed / repeat * 1000))
@@ -4,17 +4,27 @@ from django.utils.translation import ugettext_lazy as _
 
 
 # Create your models here.
-class Sprint(models.Model):
-    """Development iteration period."""
+class SprintBase(models.Model):
     name = models.CharField(max_length=100, blank=True, default='')
     description = models.TextField(blank=True, default='')
     end = models.DateField(unique=True)
 
+    class Meta:
+        abstract = True
+
     def __str__(self):
         return self.name or _('Sprint ending %s') % self.end
 
 
-class Task(models.Model):
+class Sprint(SprintBase):
+    """Development iteration period."""
+
+
+class ArchivedSprint(SprintBase):
+    """Finished sprint moved out of the board by `archive_sprints`."""
+
+
+class TaskBase(models.Model):
     STATUS_TODO = 1
     STATUS_IN_PROGRESS = 2
     STATUS_TESTING = 3
@@ -29,7 +39,6 @@ class Task(models.Model):
 
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True, default='')
-    sprint = models.ForeignKey(Sprint, blank=True, null=True)
     status = models.SmallIntegerField(choices=STATUS_CHOICES, default=STATUS_TODO)
     order = models.SmallIntegerField(default=0)
     assigned = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True)
@@ -37,5 +46,17 @@ class Task(models.Model):
     due = models.DateField(blank=True, null=True)
     completed = models.DateField(blank=True, null=True)
 
+    class Meta:
+        abstract = True
+
     def __str__(self):
         return self.name
+
+
+class Task(TaskBase):
+    sprint = models.ForeignKey(Sprint, blank=True, null=True)
+
+
+class ArchivedTask(TaskBase):
+    """Done task of an archived sprint."""
+    sprint = models.ForeignKey(ArchivedSprint, blank=True, null=True)
@@ -0,0 +1,46 @@
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSON renderer which encodes with orjson when fast mode is enabled.
+
+    Only the default compact, unicode and strict output is handled, so the
+    rendered bytes are the same as the ones `JSONRenderer` produces. Any
+    other configuration falls back to the standard renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not self.is_fast(accepted_media_type, renderer_context):
+            return super(FastJSONRenderer, self).render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return bytes()
+        try:
+            ret = orjson.dumps(data)
+        except TypeError:
+            # Lazy strings and other types left to `JSONRenderer`'s encoder
+            return super(FastJSONRenderer, self).render(data, accepted_media_type, renderer_context)
+        # Escape the line terminators the same way as `JSONRenderer` does.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+    def is_fast(self, accepted_media_type=None, renderer_context=None):
+        if orjson is None or not settings.BOARD_FAST_JSON:
+            return False
+        # `strict` only exists from DRF 3.9, the payloads here carry no floats
+        if not (self.compact and not self.ensure_ascii and getattr(self, 'strict', True)):
+            return False
+        if accepted_media_type and 'indent' in accepted_media_type:
+            return False
+        return (renderer_context or {}).get('indent') is None
+
+
+def fast_json_enabled(request):
+    """Whether `request` will be rendered by `FastJSONRenderer` in fast mode."""
+    renderer = getattr(request, 'accepted_renderer', None)
+    return (isinstance(renderer, FastJSONRenderer) and
+            renderer.is_fast(getattr(request, 'accepted_media_type', None)))
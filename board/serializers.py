@@ -1,10 +1,14 @@
 from datetime import date
+from operator import itemgetter
+from urllib.parse import quote
 from rest_framework import serializers
 from .models import Sprint, Task
 from django.utils.translation import ugettext_lazy as _
 from django.contrib.auth import get_user_model
 from django.conf import settings
 from django.core.signing import TimestampSigner
+from django.utils.encoding import force_text
+from django.utils.http import RFC3986_SUBDELIMS
 from rest_framework.reverse import reverse
 
 User = get_user_model()
@@ -90,3 +94,138 @@ class UserSerializer(serializers.ModelSerializer):
                             request=request),
             'tasks': '{}?assigned={}'.format(reverse('task-list', request=request), username)
         }
+
+
+def reverse_template(viewname, request, kwarg=None):
+    """Reverse `viewname` once and return a function building its urls.
+
+    The returned function takes the value of `kwarg` and gives the same url
+    as `reverse` would, without resolving the pattern again for each row.
+    """
+    if kwarg is None:
+        url = reverse(viewname, request=request)
+        return lambda value: url
+    marker = 'fastrowmarker'
+    url = reverse(viewname, kwargs={kwarg: marker}, request=request)
+    prefix, _, suffix = url.partition(marker)
+    safe = RFC3986_SUBDELIMS + '/~:@'
+    return lambda value: '{}{}{}'.format(prefix, quote(str(value), safe=safe), suffix)
+
+
+class RowSerializer(object):
+    """Build API representations straight from `values_list()` rows.
+
+    Fast path for list endpoints which skips model instances and the
+    serializer field machinery. Subclasses mirror a `ModelSerializer`:
+    `fields` are the output keys, `columns` the values read from the
+    database, and `get_<field>` methods compute the derived fields.
+    Columns are read from the model's own table only, so the query keeps
+    the shape, and the row order, of the default path.
+    """
+    columns = ()
+    fields = ()
+
+    def __init__(self, context):
+        self.context = context
+        index = {column: i for i, column in enumerate(self.columns)}
+        self.getters = []
+        for field in self.fields:
+            getter = getattr(self, 'get_{}'.format(field), None)
+            if getter is None:
+                getter = itemgetter(index[field])
+            self.getters.append((field, getter))
+
+    def fetch(self, queryset):
+        return queryset.values_list(*self.columns)
+
+    def serialize(self, queryset):
+        getters = self.getters
+        return [{field: getter(row) for field, getter in getters}
+                for row in self.fetch(queryset)]
+
+
+class SprintRowSerializer(RowSerializer):
+    """Fast equivalent of `SprintSerializer` for list responses."""
+    columns = ('id', 'name', 'description', 'end',)
+    fields = SprintSerializer.Meta.fields
+
+    def __init__(self, context):
+        super().__init__(context)
+        request = self.context['request']
+        self.signer = TimestampSigner(settings.WATERCOOLER_SECRET)
+        self.self_url = reverse_template('sprint-detail', request, 'pk')
+        self.tasks_url = reverse('task-list', request=request) + '?sprint={}'
+        self.channel_url = '{proto}://{server}/socket?channel={{}}'.format(
+            proto='wss' if settings.WATERCOOLER_SECURE else 'ws',
+            server=settings.WATERCOOLER_SERVER,
+        )
+
+    def get_links(self, row):
+        pk = row[0]
+        return {
+            'self': self.self_url(pk),
+            'tasks': self.tasks_url.format(pk),
+            'channel': self.channel_url.format(self.signer.sign(pk)),
+        }
+
+
+class TaskRowSerializer(RowSerializer):
+    """Fast equivalent of `TaskSerializer` for list responses."""
+    columns = ('id', 'name', 'description', 'sprint', 'status', 'order',
+               'assigned', 'started', 'due', 'completed',)
+    fields = TaskSerializer.Meta.fields
+
+    def __init__(self, context):
+        super().__init__(context)
+        request = self.context['request']
+        self.status_display = {value: force_text(label) for value, label in Task.STATUS_CHOICES}
+        self.self_url = reverse_template('task-detail', request, 'pk')
+        self.sprint_url = reverse_template('sprint-detail', request, 'pk')
+        self.assigned_url = reverse_template('user-detail', request, User.USERNAME_FIELD)
+
+    def fetch(self, queryset):
+        rows = list(super().fetch(queryset))
+        # One query for the usernames instead of a join on every row
+        ids = {row[6] for row in rows if row[6] is not None}
+        self.usernames = dict(User.objects.filter(pk__in=ids).values_list('pk', User.USERNAME_FIELD))
+        return rows
+
+    def get_assigned(self, row):
+        return self.usernames.get(row[6])
+
+    def get_status_display(self, row):
+        status = row[4]
+        return self.status_display.get(status, status)
+
+    def get_links(self, row):
+        links = {'self': self.self_url(row[0])}
+        if row[3]:
+            links['sprint'] = self.sprint_url(row[3])
+        if row[6] is not None:
+            links['assigned'] = self.assigned_url(self.usernames[row[6]])
+        return links
+
+
+class UserRowSerializer(RowSerializer):
+    """Fast equivalent of `UserSerializer` for list responses.
+
+    `full_name` is built like `AbstractUser.get_full_name`.
+    """
+    columns = ('id', User.USERNAME_FIELD, 'first_name', 'last_name', 'is_active',)
+    fields = UserSerializer.Meta.fields
+
+    def __init__(self, context):
+        super().__init__(context)
+        request = self.context['request']
+        self.self_url = reverse_template('user-detail', request, User.USERNAME_FIELD)
+        self.tasks_url = '{}?assigned={{}}'.format(reverse('task-list', request=request))
+
+    def get_full_name(self, row):
+        return '{} {}'.format(row[2], row[3]).strip()
+
+    def get_links(self, row):
+        username = row[1]
+        return {
+            'self': self.self_url(username),
+            'tasks': self.tasks_url.format(username),
+        }
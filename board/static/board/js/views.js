@@ -190,6 +190,7 @@
             this.sprint = options.sprint;
             this.status = options.status;
             this.title = options.title;
+            this.locks = options.locks || {};
         },
         getContext: function () {
             return {sprint: this.sprint, title: this.title};
@@ -229,6 +230,11 @@
                 event.stopPropagation();
             }
             task = app.tasks.get(task);
+            if (!task || this.locks[task.get('id')]) {
+                // Another user is dragging this task
+                this.leave();
+                return false;
+            }
             tasks = app.tasks.where({sprint: this.sprint, status: this.status});
             if (tasks.length) {
                 order = _.min(_.map(tasks, function (model) {
@@ -319,6 +325,7 @@
         initialize: function (options) {
             TemplateView.prototype.initialize.apply(this, arguments);
             this.task = options.task;
+            this.locks = options.locks || {};
             this.task.on('change', this.render, this);
             this.task.on('remove', this.remove, this);
         },
@@ -340,6 +347,11 @@
         },
         start: function (event) {
             var dataTransfer = event.originalEvent.dataTransfer;
+            if (this.$el.hasClass('locked')) {
+                // Another user is dragging this task
+                event.preventDefault();
+                return false;
+            }
             dataTransfer.effectAllowed = 'move';
             dataTransfer.setData('application/model', this.task.get('id'));
             this.trigger('dragstart', this.task);
@@ -369,6 +381,11 @@
                 event.stopPropagation();
             }
             task = app.tasks.get(task);
+            if (!task || this.locks[task.get('id')]) {
+                // Another user is dragging this task
+                this.leave();
+                return false;
+            }
             if (task !== this.task) {
                 // Task is being moved in front of this.task
                 order = this.task.get('order');
@@ -406,17 +423,20 @@
             this.sprintId = options.sprintId;
             this.sprint = null;
             this.tasks = {};
+            // Tasks dragged by other users, kept across re-renders and
+            // shared with the views handling drops
+            this.locks = {};
             this.statuses = {
                 unassigned: new StatusView({
-                    sprint: null, status: 1, title: 'Backlog'}),
+                    sprint: null, status: 1, title: 'Backlog', locks: this.locks}),
                 todo: new StatusView({
-                    sprint: this.sprintId, status: 1, title: 'Not Started'}),
+                    sprint: this.sprintId, status: 1, title: 'Not Started', locks: this.locks}),
                 active: new StatusView({
-                    sprint: this.sprintId, status: 2, title: 'In Development'}),
+                    sprint: this.sprintId, status: 2, title: 'In Development', locks: this.locks}),
                 testing: new StatusView({
-                    sprint: this.sprintId, status: 3, title: 'In Testing'}),
+                    sprint: this.sprintId, status: 3, title: 'In Testing', locks: this.locks}),
                 done: new StatusView({
-                    sprint: this.sprintId, status: 4, title: 'Completed'})
+                    sprint: this.sprintId, status: 4, title: 'Completed', locks: this.locks})
             };
             _.each(this.statuses, function (view, name) {
                 view.on('drop', function (model) {
@@ -470,7 +490,7 @@
             }
         },
         renderTask: function (task) {
-            var view = new TaskItemView({task: task});
+            var view = new TaskItemView({task: task, locks: this.locks});
             _.each(this.statuses, function (container, name) {
                 if (container.sprint == task.get('sprint') &&
                     container.status == task.get('status')) {
@@ -499,6 +519,9 @@
                 });
             }, this);
             view.render();
+            if (this.locks[task.get('id')]) {
+                view.lock();
+            }
             return view;
         },
         connectSocket: function () {
@@ -508,14 +531,30 @@
             if (links && links.channel) {
                 console.log('links.channel: '+links.channel);
                 this.socket = new app.Socket(links.channel);
+                this.socket.on('board:snapshot', function (sprint, result) {
+                    // Tasks not fetched yet are locked in renderTask. Update
+                    // in place as the other views share the object.
+                    _.each(_.keys(this.locks), function (task) {
+                        delete this.locks[task];
+                    }, this);
+                    _.extend(this.locks, result.body.locks);
+                    _.each(this.locks, function (owner, task) {
+                        var view = this.tasks[task];
+                        if (view) {
+                            view.lock();
+                        }
+                    }, this);
+                }, this);
                 this.socket.on('task:dragstart', function (task) {
                     var view = this.tasks[task];
+                    this.locks[task] = true;
                     if (view) {
                         view.lock();
                     }
                 }, this);
                 this.socket.on('task:dragend task:drop', function (task) {
                     var view = this.tasks[task];
+                    delete this.locks[task];
                     if (view) {
                         view.unlock();
                     }
@@ -1,3 +1,131 @@
-from django.test import TestCase
+from io import StringIO
+from datetime import date, timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from .models import Sprint, Task, ArchivedSprint, ArchivedTask
+from .renderers import orjson
+from .serializers import RowSerializer
+
+User = get_user_model()
+
+
+@skipUnless(orjson, 'orjson is not installed')
+@override_settings(WATERCOOLER_SERVER='localhost:8080', WATERCOOLER_SECURE=False)
+class FastJSONParityTestCase(TestCase):
+    """The fast list path renders the same bytes as the default serializers."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            'jerry', password='scrum1234', first_name='Jerry', last_name='Chen')
+        other = User.objects.create_user('bob+test@home', password='scrum1234')
+        User.objects.create_user('inactive', password='scrum1234', is_active=False)
+        today = date.today()
+        sprint = Sprint.objects.create(name='Sprint   one', end=today)
+        Sprint.objects.create(description='Dates only é', end=today + timedelta(days=14))
+        Task.objects.create(name='Backlog task', description='"quoted"\n\ttext')
+        Task.objects.create(name='Assigned', sprint=sprint, assigned=self.user,
+                            status=Task.STATUS_IN_PROGRESS, started=today, due=today)
+        Task.objects.create(name='Done', sprint=sprint, assigned=other, order=2,
+                            status=Task.STATUS_DONE, started=today, completed=today)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def assertParity(self, url):
+        with mock.patch('django.core.signing.time.time', return_value=1500000000):
+            with override_settings(BOARD_FAST_JSON=False):
+                expected = self.client.get(url, HTTP_ACCEPT='application/json')
+            with override_settings(BOARD_FAST_JSON=True):
+                with mock.patch.object(RowSerializer, 'serialize', autospec=True,
+                                       side_effect=RowSerializer.serialize) as serialize:
+                    actual = self.client.get(url, HTTP_ACCEPT='application/json')
+        self.assertEqual(serialize.call_count, 1)
+        self.assertEqual(expected.status_code, 200)
+        self.assertEqual(actual.status_code, 200)
+        self.assertTrue(expected.content.startswith(b'['))
+        self.assertEqual(actual.content, expected.content)
+
+    def test_sprint_list(self):
+        self.assertParity('/api/sprints')
+
+    def test_sprint_list_filtered(self):
+        self.assertParity('/api/sprints?end_min={}&ordering=-end'.format(date.today()))
+
+    def test_task_list(self):
+        self.assertParity('/api/tasks')
+
+    def test_task_list_filtered(self):
+        self.assertParity('/api/tasks?backlog=False&ordering=order')
+        self.assertParity('/api/tasks?assigned=jerry')
+
+    def test_task_list_ties(self):
+        for assigned in (None, self.user, None):
+            Task.objects.create(name='Same', assigned=assigned)
+        self.assertParity('/api/tasks?ordering=name')
+        self.assertParity('/api/tasks?ordering=order')
+
+    def test_user_list(self):
+        self.assertParity('/api/users')
+
+    def test_user_search(self):
+        self.assertParity('/api/users?search=bob')
+
+
+class ArchiveSprintsTestCase(TestCase):
+    """Finished sprints are only listed when asked for archived data."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('jerry', password='scrum1234')
+        today = date.today()
+        self.old = Sprint.objects.create(name='Old', end=today - timedelta(days=30))
+        self.current = Sprint.objects.create(name='Current', end=today)
+        self.done = Task.objects.create(name='Done', sprint=self.old, status=Task.STATUS_DONE,
+                                        assigned=self.user, completed=today)
+        self.unfinished = Task.objects.create(name='Unfinished', sprint=self.old,
+                                              status=Task.STATUS_TESTING)
+        self.active = Task.objects.create(name='Active', sprint=self.current,
+                                          status=Task.STATUS_DONE)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def archive(self):
+        call_command('archive_sprints', stdout=StringIO())
+
+    def test_command(self):
+        self.archive()
+        self.assertEqual(list(Sprint.objects.values_list('pk', flat=True)), [self.current.pk])
+        self.assertEqual(list(ArchivedSprint.objects.values_list('pk', 'name')), [(self.old.pk, 'Old')])
+        archived = ArchivedTask.objects.get()
+        self.assertEqual((archived.pk, archived.sprint_id, archived.assigned_id),
+                         (self.done.pk, self.old.pk, self.user.pk))
+        self.unfinished.refresh_from_db()
+        self.assertIsNone(self.unfinished.sprint_id)
+        self.assertFalse(Task.objects.filter(pk=self.done.pk).exists())
+
+    def test_dry_run(self):
+        call_command('archive_sprints', dry_run=True, stdout=StringIO())
+        self.assertEqual(Sprint.objects.count(), 2)
+        self.assertFalse(ArchivedSprint.objects.exists())
+
+    def test_filters(self):
+        self.archive()
+        response = self.client.get('/api/sprints')
+        self.assertEqual([sprint['id'] for sprint in response.data], [self.current.pk])
+        response = self.client.get('/api/sprints?archived=True')
+        self.assertEqual([sprint['id'] for sprint in response.data], [self.old.pk])
+        response = self.client.get('/api/tasks?archived=True&sprint={}'.format(self.old.pk))
+        self.assertEqual([task['id'] for task in response.data], [self.done.pk])
+        response = self.client.get('/api/tasks?sprint={}'.format(self.old.pk))
+        self.assertEqual(response.data, [])
+
+    def test_archived_is_read_only(self):
+        self.archive()
+        response = self.client.get('/api/tasks/{}?archived=True'.format(self.done.pk))
+        self.assertEqual(response.status_code, 200)
+        response = self.client.delete('/api/tasks/{}?archived=True'.format(self.done.pk))
+        self.assertEqual(response.status_code, 404)
+        self.assertTrue(ArchivedTask.objects.filter(pk=self.done.pk).exists())
@@ -1,5 +1,6 @@
 from rest_framework import viewsets, authentication, permissions, filters
-from rest_framework.renderers import JSONRenderer
+from rest_framework.renderers import JSONRenderer, BrowsableAPIRenderer
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from django.core.signing import TimestampSigner
 from django.contrib.auth import get_user_model
@@ -7,7 +8,9 @@ from django.conf import settings
 
 from .forms import TaskFilter, SprintFilter
 from .models import Sprint, Task
+from .renderers import FastJSONRenderer, fast_json_enabled
 from .serializers import SprintSerializer, TaskSerializer, UserSerializer
+from .serializers import SprintRowSerializer, TaskRowSerializer, UserRowSerializer
 import requests
 import hashlib
 
@@ -25,6 +28,10 @@ class DefaultsMixin(object):
     permission_classes = (
         permissions.IsAuthenticated,
     )
+    renderer_classes = (
+        FastJSONRenderer,
+        BrowsableAPIRenderer,
+    )
     paginate_by = 25
     paginate_by_param = 'page_size'
     max_paginate_by = 100
@@ -35,6 +42,21 @@ class DefaultsMixin(object):
     )
 
 
+class FastListMixin(object):
+    """Mixin class to serialize list responses from plain database rows
+    when the fast JSON mode is enabled."""
+
+    row_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if (self.row_serializer_class is None or self.paginator is not None or
+                not fast_json_enabled(request)):
+            return super(FastListMixin, self).list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.row_serializer_class(context=self.get_serializer_context())
+        return Response(serializer.serialize(queryset))
+
+
 class UpdateHookMixin(object):
     """Mixin class to send update information to the websocket server."""
 
@@ -96,28 +118,31 @@ class UpdateHookMixin(object):
         super(UpdateHookMixin, self).perform_destroy(instance)
 
 
-class SprintViewSet(DefaultsMixin, UpdateHookMixin, viewsets.ModelViewSet):
+class SprintViewSet(DefaultsMixin, FastListMixin, UpdateHookMixin, viewsets.ModelViewSet):
     """API endpoint for listing and creating sprints."""
     queryset = Sprint.objects.order_by('end')
     serializer_class = SprintSerializer
+    row_serializer_class = SprintRowSerializer
     filter_class = SprintFilter
     search_fields = ('name',)
     ordering_fields = ('end', 'name',)
 
 
-class TaskViewSet(DefaultsMixin, UpdateHookMixin, viewsets.ModelViewSet):
+class TaskViewSet(DefaultsMixin, FastListMixin, UpdateHookMixin, viewsets.ModelViewSet):
     """API endpoint for listing and creating tasks."""
-    queryset = Task.objects.all()
+    queryset = Task.objects.order_by('pk')
     serializer_class = TaskSerializer
+    row_serializer_class = TaskRowSerializer
     filter_class = TaskFilter
     search_fields = ('name', 'description',)
     ordering_fields = ('name', 'order', 'started', 'due', 'completed',)
 
 
-class UserViewSet(DefaultsMixin, UpdateHookMixin, viewsets.ReadOnlyModelViewSet):
+class UserViewSet(DefaultsMixin, FastListMixin, UpdateHookMixin, viewsets.ReadOnlyModelViewSet):
     """API endpoint for listing users."""
     lookup_field = User.USERNAME_FIELD
     lookup_url_kwarg = User.USERNAME_FIELD
     queryset = User.objects.order_by(User.USERNAME_FIELD)
     serializer_class = UserSerializer
+    row_serializer_class = UserRowSerializer
     search_fields = (User.USERNAME_FIELD,)
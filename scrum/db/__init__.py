@@ -0,0 +1,11 @@
+"""PostgreSQL backend with connection health checks and optional pooling.
+
+Use it as the database `ENGINE`. Besides the usual settings it reads:
+
+* ``HEALTH_CHECKS``: check a persistent connection (see ``CONN_MAX_AGE``)
+  is still usable before its first use in each request.
+* ``POOL``: a dict with ``ENABLED``, ``MAX_SIZE`` and ``TIMEOUT``. When
+  enabled, connections come from a pool shared by all threads of the
+  process and go back to it at the end of every request, whatever
+  ``CONN_MAX_AGE`` is.
+"""
@@ -0,0 +1,95 @@
+import threading
+import time
+
+from django.db.backends.postgresql.base import Database, DatabaseWrapper as PostgresDatabaseWrapper
+
+from .pool import ConnectionPool
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def pool_stats():
+    """Metrics of every connection pool of the process, by database alias."""
+    with _pools_lock:
+        pools = dict(_pools)
+    return {alias: pool.stats() for (alias, name), pool in pools.items()}
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+
+    def __init__(self, *args, **kwargs):
+        super(DatabaseWrapper, self).__init__(*args, **kwargs)
+        self.health_check_enabled = self.settings_dict.get('HEALTH_CHECKS', False)
+        self.health_check_done = False
+        self.pool = None
+
+    def get_pool(self, conn_params):
+        options = self.settings_dict.get('POOL') or {}
+        if not options.get('ENABLED', False):
+            return None
+        # The test runner switches NAME to the test database
+        key = (self.alias, self.settings_dict['NAME'])
+        with _pools_lock:
+            if key not in _pools:
+                _pools[key] = ConnectionPool(
+                    lambda: self.connect_to_pool(conn_params),
+                    max_size=options.get('MAX_SIZE', 10),
+                    timeout=options.get('TIMEOUT', 5.0),
+                    health_checks=self.health_check_enabled,
+                )
+            return _pools[key]
+
+    def connect_to_pool(self, conn_params):
+        # Runs in whichever thread grows the pool, so keep it free of state
+        connection = Database.connect(**conn_params)
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        if isolation_level is not None and isolation_level != connection.isolation_level:
+            connection.set_session(isolation_level=isolation_level)
+        return connection
+
+    def get_new_connection(self, conn_params):
+        self.pool = self.get_pool(conn_params)
+        if self.pool is None:
+            return super(DatabaseWrapper, self).get_new_connection(conn_params)
+        connection = self.pool.acquire()
+        self.isolation_level = connection.isolation_level
+        return connection
+
+    def connect(self):
+        super(DatabaseWrapper, self).connect()
+        # A new or pooled connection has just been checked
+        self.health_check_done = True
+        if self.pool is not None:
+            # Hand the connection back to the pool at the end of the request
+            self.close_at = time.time()
+
+    def _cursor(self, *args, **kwargs):
+        # Not in ensure_connection, which get_autocommit also calls when a
+        # request starts
+        self.close_if_health_check_failed()
+        return super(DatabaseWrapper, self)._cursor(*args, **kwargs)
+
+    def close_if_health_check_failed(self):
+        """Close a persistent connection which can no longer be used."""
+        if (self.connection is None or not self.health_check_enabled or
+                self.health_check_done or self.in_atomic_block):
+            return
+        if not self.is_usable():
+            self.close()
+        self.health_check_done = True
+
+    def close_if_unusable_or_obsolete(self):
+        # Called at the start and end of each request
+        if self.connection is not None:
+            self.health_check_done = False
+        super(DatabaseWrapper, self).close_if_unusable_or_obsolete()
+
+    def _close(self):
+        if self.pool is None or self.connection is None:
+            return super(DatabaseWrapper, self)._close()
+        # Don't hand out connections Django gave up on or left out of autocommit
+        discard = (bool(self.connection.closed) or self.errors_occurred or
+                   self.connection.autocommit != self.settings_dict['AUTOCOMMIT'])
+        with self.wrap_database_errors:
+            self.pool.release(self.connection, discard=discard)
@@ -0,0 +1,155 @@
+import collections
+import threading
+import time
+
+
+class PoolTimeout(Exception):
+    """No connection was released before the pool timeout."""
+
+
+def ping(connection):
+    """Default health check, run a trivial query on the connection."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute('SELECT 1')
+    finally:
+        cursor.close()
+
+
+def rollback(connection):
+    """Default reset, drop whatever transaction was left open."""
+    connection.rollback()
+
+
+class ConnectionPool(object):
+    """Thread safe pool of DB-API connections.
+
+    Connections are opened lazily with `connect` up to `max_size`. Idle
+    connections are handed out most recently used first and, when
+    `health_checks` is set, checked with `check` before being returned.
+    Released connections are cleaned with `reset`; any connection failing
+    either of them is closed and replaced.
+    """
+
+    def __init__(self, connect, max_size=10, timeout=5.0, health_checks=True,
+                 check=ping, reset=rollback):
+        self.connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_checks = health_checks
+        self.check = check
+        self.reset = reset
+        self._idle = collections.deque()
+        self._size = 0
+        self._in_use = 0
+        self._lock = threading.Condition()
+        self._created = 0
+        self._acquired = 0
+        self._discarded = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def acquire(self):
+        """Check out a connection, waiting up to `timeout` seconds for one."""
+        start = time.monotonic()
+        deadline = start + self.timeout
+        connection = None
+        with self._lock:
+            waited = False
+            while not self._idle and self._size >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout('No connection available within {}s'.format(self.timeout))
+                if not waited:
+                    waited = True
+                    self._waits += 1
+                self._lock.wait(remaining)
+            if self._idle:
+                connection = self._idle.pop()
+            else:
+                # Reserve the slot before connecting outside the lock
+                self._size += 1
+            self._in_use += 1
+            self._acquired += 1
+            wait_time = time.monotonic() - start
+            self._wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+        if connection is not None and self.health_checks and not self._healthy(connection):
+            self._close(connection)
+            with self._lock:
+                self._discarded += 1
+            connection = None
+        if connection is None:
+            try:
+                connection = self.connect()
+            except Exception:
+                with self._lock:
+                    self._size -= 1
+                    self._in_use -= 1
+                    self._lock.notify()
+                raise
+            with self._lock:
+                self._created += 1
+        return connection
+
+    def release(self, connection, discard=False):
+        """Hand a connection back to the pool, or close it if `discard`."""
+        if not discard:
+            try:
+                self.reset(connection)
+            except Exception:
+                discard = True
+        if discard:
+            self._close(connection)
+        with self._lock:
+            self._in_use -= 1
+            if discard:
+                self._size -= 1
+                self._discarded += 1
+            else:
+                self._idle.append(connection)
+            self._lock.notify()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._lock.notify_all()
+        for connection in idle:
+            self._close(connection)
+
+    def stats(self):
+        """Usage and wait metrics of the pool."""
+        with self._lock:
+            return {
+                'max_size': self.max_size,
+                'size': self._size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'created': self._created,
+                'acquired': self._acquired,
+                'discarded': self._discarded,
+                'waits': self._waits,
+                'timeouts': self._timeouts,
+                'wait_time': self._wait_time,
+                'max_wait_time': self._max_wait_time,
+            }
+
+    def _healthy(self, connection):
+        try:
+            self.check(connection)
+        except Exception:
+            return False
+        return True
+
+    @staticmethod
+    def _close(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -70,14 +70,25 @@ WSGI_APPLICATION = 'scrum.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/1.11/ref/settings/#databases
 
+# Connections are kept open for DB_CONN_MAX_AGE seconds and checked before
+# reuse. With DB_POOL set, they go back at the end of each request to a pool
+# shared by the threads of the process, and DB_CONN_MAX_AGE is not used.
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql_psycopg2',
+        'ENGINE': 'scrum.db',
         'NAME': 'scrum',
         'USER': 'scrumuser',
         'PASSWORD': 'password',
         'HOST': 'localhost',
         'PORT': 5433,
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        'HEALTH_CHECKS': True,
+        'POOL': {
+            'ENABLED': bool(os.environ.get('DB_POOL', '')),
+            'MAX_SIZE': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            'TIMEOUT': float(os.environ.get('DB_POOL_TIMEOUT', 5)),
+        },
     }
 }
 
@@ -121,4 +132,9 @@ WATERCOOLER_SERVER = os.environ.get('WATERCOOLER_SERVER', 'localhost:8080')
 
 WATERCOOLER_SECURE = bool(os.environ.get('WATERCOOLER_SECURE', ''))
 
-WATERCOOLER_SECRET = os.environ.get('WATERCOOLER_SECRET', 'pTyz1dzMeVUGrb0Su4QXsP984qTlvQRHpFnnlHuH')
\ No newline at end of file
+WATERCOOLER_SECRET = os.environ.get('WATERCOOLER_SECRET', 'pTyz1dzMeVUGrb0Su4QXsP984qTlvQRHpFnnlHuH')
+
+# Serialize list responses straight from database rows and encode them with
+# orjson, which must be installed separately. The output is the same as the
+# default serializers and renderer.
+BOARD_FAST_JSON = bool(os.environ.get('BOARD_FAST_JSON', ''))
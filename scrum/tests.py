@@ -0,0 +1,169 @@
+import copy
+import sqlite3
+import threading
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from .db.base import DatabaseWrapper, _pools
+from .db.pool import ConnectionPool, PoolTimeout
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    """Pool behaviour, with SQLite connections standing in for PostgreSQL."""
+
+    def setUp(self):
+        self.pool = ConnectionPool(
+            lambda: sqlite3.connect(':memory:', check_same_thread=False),
+            max_size=2, timeout=0.1)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_reuse(self):
+        connection = self.pool.acquire()
+        self.pool.release(connection)
+        self.assertIs(self.pool.acquire(), connection)
+        stats = self.pool.stats()
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(stats['acquired'], 2)
+        self.assertEqual(stats['in_use'], 1)
+        self.assertEqual(stats['idle'], 0)
+
+    def test_timeout(self):
+        self.pool.acquire()
+        self.pool.acquire()
+        with self.assertRaises(PoolTimeout):
+            self.pool.acquire()
+        stats = self.pool.stats()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['waits'], 1)
+        self.assertEqual(stats['timeouts'], 1)
+
+    def test_wait_for_release(self):
+        self.pool.timeout = 5
+        first = self.pool.acquire()
+        self.pool.acquire()
+        timer = threading.Timer(0.05, self.pool.release, args=(first,))
+        timer.start()
+        self.assertIs(self.pool.acquire(), first)
+        timer.join()
+        stats = self.pool.stats()
+        self.assertEqual(stats['waits'], 1)
+        self.assertGreater(stats['max_wait_time'], 0)
+
+    def test_health_check_replaces_broken_connection(self):
+        connection = self.pool.acquire()
+        self.pool.release(connection)
+        connection.close()
+        replacement = self.pool.acquire()
+        self.assertIsNot(replacement, connection)
+        replacement.execute('SELECT 1')
+        stats = self.pool.stats()
+        self.assertEqual(stats['discarded'], 1)
+        self.assertEqual(stats['size'], 1)
+
+    def test_release_rolls_back(self):
+        connection = self.pool.acquire()
+        connection.execute('CREATE TABLE item (name TEXT)')
+        connection.commit()
+        connection.execute("INSERT INTO item VALUES ('pending')")
+        self.pool.release(connection)
+        connection = self.pool.acquire()
+        self.assertEqual(connection.execute('SELECT COUNT(*) FROM item').fetchone(), (0,))
+
+    def test_discard(self):
+        connection = self.pool.acquire()
+        self.pool.release(connection, discard=True)
+        self.assertIsNot(self.pool.acquire(), connection)
+        self.assertEqual(self.pool.stats()['created'], 2)
+
+    def test_failed_connect_frees_slot(self):
+        pool = ConnectionPool(lambda: 1 / 0, max_size=1, timeout=0.1)
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                pool.acquire()
+        self.assertEqual(pool.stats()['size'], 0)
+
+
+class DatabaseWrapperTestCase(TestCase):
+    """Health checks and pooling of the backend, on the test database."""
+
+    def make_wrapper(self, alias, **settings):
+        settings_dict = copy.deepcopy(connection.settings_dict)
+        settings_dict.update(settings)
+        wrapper = DatabaseWrapper(settings_dict, alias=alias)
+        self.addCleanup(self.close_wrapper, wrapper)
+        return wrapper
+
+    def close_wrapper(self, wrapper):
+        wrapper.close()
+        pool = _pools.pop((wrapper.alias, wrapper.settings_dict['NAME']), None)
+        if pool is not None:
+            pool.close()
+
+    def pooled_wrapper(self):
+        return self.make_wrapper('pooled', CONN_MAX_AGE=60, HEALTH_CHECKS=True,
+                                 POOL={'ENABLED': True, 'MAX_SIZE': 1, 'TIMEOUT': 0.1})
+
+    def test_pool_release_at_request_end(self):
+        wrapper = self.pooled_wrapper()
+        wrapper.ensure_connection()
+        raw = wrapper.connection
+        # What the request_finished signal does
+        wrapper.close_if_unusable_or_obsolete()
+        self.assertIsNone(wrapper.connection)
+        self.assertEqual(wrapper.pool.stats()['idle'], 1)
+        wrapper.ensure_connection()
+        self.assertIs(wrapper.connection, raw)
+        stats = wrapper.pool.stats()
+        self.assertEqual((stats['created'], stats['acquired'], stats['in_use']), (1, 2, 1))
+
+    def test_pool_discards_closed_connection(self):
+        wrapper = self.pooled_wrapper()
+        wrapper.ensure_connection()
+        wrapper.connection.close()
+        wrapper.close()
+        stats = wrapper.pool.stats()
+        self.assertEqual((stats['discarded'], stats['size']), (1, 0))
+        with wrapper.cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+    def test_health_check_replaces_broken_connection(self):
+        wrapper = self.make_wrapper('persistent', CONN_MAX_AGE=None, HEALTH_CHECKS=True)
+        wrapper.ensure_connection()
+        raw = wrapper.connection
+        raw.close()
+        wrapper.close_if_unusable_or_obsolete()
+        self.assertIs(wrapper.connection, raw)
+        with wrapper.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        self.assertIsNot(wrapper.connection, raw)
+
+    def test_health_check_once_per_request(self):
+        wrapper = self.make_wrapper('persistent', CONN_MAX_AGE=None, HEALTH_CHECKS=True)
+        wrapper.ensure_connection()
+        with mock.patch.object(wrapper, 'is_usable', wraps=wrapper.is_usable) as is_usable:
+            # What the request_started and request_finished signals do
+            wrapper.close_if_unusable_or_obsolete()
+            with wrapper.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            with wrapper.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            wrapper.close_if_unusable_or_obsolete()
+            self.assertEqual(is_usable.call_count, 1)
+            # A request which never queries the database does not ping it
+            wrapper.close_if_unusable_or_obsolete()
+            wrapper.close_if_unusable_or_obsolete()
+            self.assertEqual(is_usable.call_count, 1)
+
+    def test_pool_discards_connection_out_of_autocommit(self):
+        wrapper = self.pooled_wrapper()
+        wrapper.ensure_connection()
+        wrapper.set_autocommit(False)
+        wrapper.close_if_unusable_or_obsolete()
+        stats = wrapper.pool.stats()
+        self.assertEqual((stats['discarded'], stats['idle']), (1, 0))
+        wrapper.ensure_connection()
+        self.assertTrue(wrapper.get_autocommit())
@@ -0,0 +1,94 @@
+import time
+import unittest
+import uuid
+from unittest import mock
+
+from redis import Redis
+from redis.exceptions import ConnectionError
+
+from watercooler import BoardState
+
+
+class BoardStateTestCase(unittest.TestCase):
+    """Presence and drag locks, against a local Redis server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.redis = Redis()
+        try:
+            cls.redis.ping()
+        except ConnectionError:
+            raise unittest.SkipTest('Redis is not available')
+
+    def setUp(self):
+        self.state = BoardState(self.redis, lock_ttl=30, presence_ttl=60)
+        self.channel = 'test-{}'.format(uuid.uuid4().hex)
+        self.addCleanup(self.redis.delete, self.state._key(self.channel, 'users'),
+                        self.state._key(self.channel, 'locks'))
+        self.now = time.time()
+
+    def at(self, seconds):
+        """Run the state as if `seconds` had passed."""
+        return mock.patch('watercooler.time.time', return_value=self.now + seconds)
+
+    def test_lock_conflict(self):
+        self.assertIsNone(self.state.lock(self.channel, 1, 'a'))
+        self.assertEqual(self.state.lock(self.channel, 1, 'b'), 'a')
+        self.assertIsNone(self.state.lock(self.channel, 1, 'a'))
+        self.assertIsNone(self.state.lock(self.channel, 2, 'b'))
+
+    def test_expired_lock_taken_over(self):
+        with self.at(0):
+            self.state.lock(self.channel, 1, 'a')
+        with self.at(31):
+            self.assertIsNone(self.state.lock(self.channel, 1, 'b'))
+            self.assertEqual(self.state.lock(self.channel, 1, 'a'), 'b')
+
+    def test_unlock(self):
+        with self.at(0):
+            self.state.lock(self.channel, 1, 'a')
+            self.assertFalse(self.state.unlock(self.channel, 1, 'b'))
+            self.assertEqual(self.state.lock(self.channel, 1, 'b'), 'a')
+        with self.at(31):
+            # An expired lock no longer blocks other connections
+            self.assertTrue(self.state.unlock(self.channel, 1, 'b'))
+        self.assertTrue(self.state.unlock(self.channel, 1, 'a'))
+        self.assertIsNone(self.state.lock(self.channel, 1, 'b'))
+        # Unlocking a task nobody holds is fine
+        self.assertTrue(self.state.unlock(self.channel, 2, 'b'))
+
+    def test_leave_releases_locks(self):
+        self.state.join(self.channel, 'a')
+        self.state.join(self.channel, 'b')
+        self.state.lock(self.channel, 1, 'a')
+        self.state.lock(self.channel, 2, 'a')
+        self.state.lock(self.channel, 3, 'b')
+        self.assertEqual(sorted(self.state.leave(self.channel, 'a')), ['1', '2'])
+        snapshot = self.state.snapshot(self.channel)
+        self.assertEqual(snapshot, {'users': ['b'], 'locks': {'3': 'b'}})
+
+    def test_snapshot(self):
+        with self.at(-61):
+            self.state.join(self.channel, 'gone')
+        self.state.join(self.channel, 'a')
+        self.state.join(self.channel, 'b')
+        self.state.lock(self.channel, 1, 'gone')
+        self.state.lock(self.channel, 2, 'a')
+        with self.at(-31):
+            self.state.lock(self.channel, 3, 'b')
+        snapshot = self.state.snapshot(self.channel)
+        self.assertEqual(sorted(snapshot['users']), ['a', 'b'])
+        # Locks of departed connections and expired locks are left out
+        self.assertEqual(snapshot['locks'], {'2': 'a'})
+        self.assertFalse(self.redis.hexists(self.state._key(self.channel, 'users'), 'gone'))
+
+    def test_touch(self):
+        with self.at(-61):
+            self.state.join(self.channel, 'a')
+            self.state.join(self.channel, 'b')
+        self.state.touch(self.channel, ['a'])
+        self.assertEqual(self.state.snapshot(self.channel)['users'], ['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
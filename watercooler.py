@@ -2,7 +2,7 @@ from urllib.parse import urlparse
 
 from django.core.signing import TimestampSigner, BadSignature, SignatureExpired
 from django.utils.crypto import constant_time_compare
-from tornado.ioloop import IOLoop
+from tornado.ioloop import IOLoop, PeriodicCallback
 from tornado.options import define, parse_command_line, options
 from tornado.web import Application, RequestHandler, HTTPError
 from tornado.websocket import WebSocketHandler, WebSocketClosedError
@@ -22,6 +22,114 @@ define('debug', default=True, type=bool, help='Run in debug mode')
 define('port', default=8080, type=int, help='Server port')
 define('allowed_hosts', default='localhost:8000', multiple=True,
        help='Allowed hosts for cross domain connections')
+define('lock_ttl', default=30, type=int, help='Seconds before a task drag lock expires')
+define('presence_ttl', default=60, type=int,
+       help='Seconds before connections of a stopped process leave the board state')
+
+LOCK_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], ARGV[1])
+if current then
+    local owner, expires = string.match(current, '^(.*)|(.*)$')
+    if owner ~= ARGV[2] and tonumber(expires) > tonumber(ARGV[3]) then
+        return owner
+    end
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2] .. '|' .. ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return false
+"""
+
+UNLOCK_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], ARGV[1])
+if current then
+    local owner, expires = string.match(current, '^(.*)|(.*)$')
+    if owner ~= ARGV[2] then
+        return tonumber(expires) <= tonumber(ARGV[3])
+    end
+    redis.call('HDEL', KEYS[1], ARGV[1])
+end
+return true
+"""
+
+
+class BoardState(object):
+    """Connected clients and task drag locks of each sprint channel.
+
+    The state is kept in two Redis hashes per channel so that every
+    watercooler process shares it. `users` maps connection ids to the time
+    they were last seen and `locks` maps task ids to `owner|expires`.
+    """
+
+    def __init__(self, redis, lock_ttl=30, presence_ttl=60):
+        self.redis = redis
+        self.lock_ttl = lock_ttl
+        self.presence_ttl = presence_ttl
+        self._lock = redis.register_script(LOCK_SCRIPT)
+        self._unlock = redis.register_script(UNLOCK_SCRIPT)
+
+    def _key(self, channel, kind):
+        return 'watercooler:{}:{}'.format(channel, kind)
+
+    def join(self, channel, uid):
+        self.touch(channel, [uid])
+
+    def touch(self, channel, uids):
+        """Mark connections as still present."""
+        key = self._key(channel, 'users')
+        now = time.time()
+        pipe = self.redis.pipeline()
+        pipe.hmset(key, {uid: now for uid in uids})
+        pipe.expire(key, self.presence_ttl)
+        pipe.execute()
+
+    def leave(self, channel, uid):
+        """Forget a connection and return the tasks it had locked."""
+        self.redis.hdel(self._key(channel, 'users'), uid)
+        released = []
+        for task, (owner, expires) in self._locks(channel).items():
+            if owner == uid and self._unlock(keys=[self._key(channel, 'locks')],
+                                             args=[task, uid, time.time()]):
+                released.append(task)
+        return released
+
+    def lock(self, channel, task, uid):
+        """Lock `task` for `uid`, return the other owner if it is held."""
+        now = time.time()
+        owner = self._lock(keys=[self._key(channel, 'locks')],
+                           args=[task, uid, now, now + self.lock_ttl,
+                                 max(self.lock_ttl, self.presence_ttl)])
+        return owner.decode('utf-8') if owner else None
+
+    def unlock(self, channel, task, uid):
+        """Release `task`, False when another connection holds the lock."""
+        return bool(self._unlock(keys=[self._key(channel, 'locks')],
+                                 args=[task, uid, time.time()]))
+
+    def snapshot(self, channel):
+        """Present connections and live locks of the channel."""
+        now = time.time()
+        users = []
+        stale = []
+        for uid, seen in self.redis.hgetall(self._key(channel, 'users')).items():
+            uid = uid.decode('utf-8')
+            if now - float(seen) > self.presence_ttl:
+                stale.append(uid)
+            else:
+                users.append(uid)
+        if stale:
+            self.redis.hdel(self._key(channel, 'users'), *stale)
+        locks = {}
+        for task, (owner, expires) in self._locks(channel).items():
+            if owner in users and expires > now:
+                locks[task] = owner
+        return {'users': users, 'locks': locks}
+
+    def _locks(self, channel):
+        locks = {}
+        for task, value in self.redis.hgetall(self._key(channel, 'locks')).items():
+            owner, _, expires = value.decode('utf-8').rpartition('|')
+            locks[task.decode('utf-8')] = (owner, float(expires))
+        return locks
 
 
 class RedisSubscriber(BaseSubscriber):
@@ -81,16 +189,50 @@ class SprintHandler(WebSocketHandler):
                 self.uid = uuid.uuid4().hex
                 print('sprint: {}'.format(self.sprint))
                 self.application.add_subscriber(self.sprint, self)
+                self.send_snapshot()
+
+    def send_snapshot(self):
+        """ Tell a new client who is connected and which tasks are locked. """
+        body = self.application.state.snapshot(self.sprint)
+        body['uid'] = self.uid
+        self.write_message(json.dumps({
+            'model': 'board',
+            'id': self.sprint,
+            'action': 'snapshot',
+            'body': body
+        }))
 
     def on_message(self, message):
         """ Broadcast updates to other interested clients. """
-        if self.sprint is not None:
+        if self.sprint is not None and self.update_locks(message):
             self.application.broadcast(message, channel=self.sprint, sender=self)
 
+    def update_locks(self, message):
+        """ Track drag locks, return False if the message conflicts with one. """
+        try:
+            message = json.loads(message)
+            model, task, action = message['model'], int(message['id']), message['action']
+        except (ValueError, TypeError, KeyError):
+            return True
+        if model != 'task':
+            return True
+        state = self.application.state
+        if action == 'dragstart':
+            if state.lock(self.sprint, task, self.uid) is not None:
+                # Another client holds the task, lock it here as well
+                self.write_message(json.dumps({'model': 'task', 'id': task, 'action': 'dragstart'}))
+                return False
+        elif action in ('dragend', 'drop'):
+            return state.unlock(self.sprint, task, self.uid)
+        return True
+
     def on_close(self):
         """ Remove subscription. """
         if self.sprint is not None:
             self.application.remove_subscriber(self.sprint, self)
+            for task in self.application.state.leave(self.sprint, self.uid):
+                message = json.dumps({'model': 'task', 'id': int(task), 'action': 'dragend'})
+                self.application.broadcast(message, channel=self.sprint, sender=self)
 
 
 class UpdateHandler(RequestHandler):
@@ -149,15 +291,31 @@ class ScrumApplication(Application):
         self.publisher = Redis()
         self._key = os.environ.get('WATERCOOLER_SECRET', 'pTyz1dzMeVUGrb0Su4QXsP984qTlvQRHpFnnlHuH')
         self.signer = TimestampSigner(self._key)
+        self.state = BoardState(self.publisher, lock_ttl=options.lock_ttl,
+                                presence_ttl=options.presence_ttl)
+        self.connections = {}
+        self.heartbeat = PeriodicCallback(self.touch_connections, options.presence_ttl * 1000 / 3)
+        self.heartbeat.start()
 
     def add_subscriber(self, channel, subscriber):
         print('add_subscriber')
         self.subscriber.subscribe(['all', channel], subscriber)
+        self.connections.setdefault(channel, set()).add(subscriber.uid)
+        self.state.join(channel, subscriber.uid)
 
     def remove_subscriber(self, channel, subscriber):
         print('remove_subscriber')
         self.subscriber.unsubscribe(channel, subscriber)
         self.subscriber.unsubscribe('all', subscriber)
+        uids = self.connections.get(channel, set())
+        uids.discard(subscriber.uid)
+        if not uids:
+            self.connections.pop(channel, None)
+
+    def touch_connections(self):
+        """ Keep the presence of this process' connections alive. """
+        for channel, uids in self.connections.items():
+            self.state.touch(channel, uids)
 
     def broadcast(self, message, channel=None, sender=None):
         print('broadcast: {}'.format(message))